@@ -1,10 +1,14 @@
 from contextlib import contextmanager
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain
 import logging
+import operator
 import os
+import sys
 import time
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, Optional
 
 import numpy as np
 import pandas as pd
@@ -13,10 +17,37 @@ import pandas as pd
 logger = logging.getLogger("birdwatch.constants")
 logger.setLevel(logging.INFO)
 
+# Shared dtype instances used throughout the TSV schemas below.  Numpy types are stored
+# as np.dtype instances so pandas does not need to normalize them on every read/astype.
+_float64 = np.dtype(np.float64)
+_int64 = np.dtype(np.int64)
+_int8 = np.dtype(np.int8)
+_nullableInt8 = pd.Int8Dtype()
+_nullableInt64 = pd.Int64Dtype()
+_nullableBoolean = pd.BooleanDtype()
+
+
+def _split_columns_and_types(columnsAndTypes):
+  """Split a list of (column, dtype) pairs into column names, dtypes and a dtype mapping.
+
+  Columns and types are returned as lists since pandas treats a tuple as a single
+  (MultiIndex) label when selecting columns.
+  """
+  columns, types = zip(*columnsAndTypes)
+  return list(columns), list(types), dict(columnsAndTypes)
+
+
+def default_num_threads() -> int:
+  """Return the number of CPUs this process may run on.
+
+  Honors CPU affinity (e.g. taskset or container cpusets) where the platform supports it,
+  falling back to os.cpu_count() and finally 8.
+  """
+  try:
+    return len(os.sched_getaffinity(0))
+  except AttributeError:
+    return os.cpu_count() or 8
 
-# Default number of threads to use in torch if os.cpu_count() is unavailable
-# and no value is specified.
-defaultNumThreads = os.cpu_count() or 8
 
 # Store the timestamp at which the constants module is initialized.  Note
 # that module initialization occurs only once regardless of how many times
@@ -27,6 +58,17 @@ defaultNumThreads = os.cpu_count() or 8
 #
 # https://docs.python.org/3/tutorial/modules.html#more-on-modules
 epochMillis = 1000 * time.time()
+
+
+def now_millis(_t=time.time):
+  """Return the current wall clock time in milliseconds.
+
+  Unlike epochMillis, this is evaluated on every call.  Tests may pass a fixed
+  clock as _t or monkeypatch this function to control "now".
+  """
+  return 1000 * _t()
+
+
 useCurrentTimeInsteadOfEpochMillisForNoteStatusHistory = True
 # Use this size threshld to isolate code which should be run differently in small
 # scale unit tests.
@@ -77,9 +119,11 @@ numberOfTimesEarnedOutKey = "numberOfTimesEarnedOut"
 defaultIndexKey = "index"
 
 # Scoring Groups
-coreGroups: Set[int] = {1, 2, 3, 6, 8, 9, 10, 11, 13, 14, 19, 21, 25}
-expansionGroups: Set[int] = {0, 4, 5, 7, 12, 16, 18, 20, 22, 23, 24, 26, 27, 28}
-expansionPlusGroups: Set[int] = {15, 17, 29, 30}
+coreGroups: FrozenSet[int] = frozenset({1, 2, 3, 6, 8, 9, 10, 11, 13, 14, 19, 21, 25})
+expansionGroups: FrozenSet[int] = frozenset(
+  {0, 4, 5, 7, 12, 16, 18, 20, 22, 23, 24, 26, 27, 28}
+)
+expansionPlusGroups: FrozenSet[int] = frozenset({15, 17, 29, 30})
 
 # TSV Values
 notHelpfulValueTsv = "NOT_HELPFUL"
@@ -146,12 +190,14 @@ internalRaterReputationKey = "internalRaterReputation"
 scorerNameKey = "scorerName"
 
 
+@lru_cache(maxsize=None)
 def note_factor_key(i):
-  return internalNoteFactorKeyBase + str(i)
+  return sys.intern(internalNoteFactorKeyBase + str(i))
 
 
+@lru_cache(maxsize=None)
 def rater_factor_key(i):
-  return internalRaterFactorKeyBase + str(i)
+  return sys.intern(internalRaterFactorKeyBase + str(i))
 
 
 internalNoteFactor1Key = note_factor_key(1)
@@ -286,9 +332,15 @@ helpfulTagsAndTieBreakOrder = [
   (1, helpfulUnbiasedLanguageTagKey),
 ]
 helpfulTagsTSVOrder = [tag for (tiebreakOrder, tag) in helpfulTagsAndTieBreakOrder]
-helpfulTagBoolsAndTypesTSVOrder = [(tag, pd.Int8Dtype()) for tag in helpfulTagsTSVOrder]
-helpfulTagsTiebreakOrder = [tag for (tiebreakOrder, tag) in sorted(helpfulTagsAndTieBreakOrder)]
-helpfulTagCountsAndTypesTSVOrder = [(tag, pd.Int64Dtype()) for tag in helpfulTagsTSVOrder]
+helpfulTagBoolsAndTypesTSVOrder = [(tag, _nullableInt8) for tag in helpfulTagsTSVOrder]
+helpfulTagsTiebreakOrder = [
+  tag for (_, tag) in sorted(helpfulTagsAndTieBreakOrder, key=operator.itemgetter(0))
+]
+helpfulTagCountsAndTypesTSVOrder = [(tag, _nullableInt64) for tag in helpfulTagsTSVOrder]
+# Structured (tiebreak order, tag) arrays in TSV order, so the winning tag among a set of
+# candidates can be selected with a mask and np.argmax over the "order" field.
+tagTiebreakDtype = np.dtype([("order", np.int8), ("tag", object)])
+helpfulTagsTiebreakArray = np.array(helpfulTagsAndTieBreakOrder, dtype=tagTiebreakDtype)
 
 
 # NOTE: Always add new tags to the end of this list, and *never* change the order of
@@ -326,28 +378,41 @@ notHelpfulTagsAndTieBreakOrder = [
   (6, notHelpfulNoteNotNeededKey),
 ]
 notHelpfulTagsTSVOrder = [tag for (tiebreakOrder, tag) in notHelpfulTagsAndTieBreakOrder]
-notHelpfulTagsAndTypesTSVOrder = [(tag, pd.Int8Dtype()) for tag in notHelpfulTagsTSVOrder]
-notHelpfulTagCountsAndTypesTSVOrder = [(tag, pd.Int64Dtype()) for tag in notHelpfulTagsTSVOrder]
+notHelpfulTagsAndTypesTSVOrder = [(tag, _nullableInt8) for tag in notHelpfulTagsTSVOrder]
+notHelpfulTagCountsAndTypesTSVOrder = [(tag, _nullableInt64) for tag in notHelpfulTagsTSVOrder]
 notHelpfulTagsTiebreakOrder = [
-  tag for (tiebreakOrder, tag) in sorted(notHelpfulTagsAndTieBreakOrder)
+  tag for (_, tag) in sorted(notHelpfulTagsAndTieBreakOrder, key=operator.itemgetter(0))
 ]
+# Retained for external callers; prefer notHelpfulTagTiebreakByEnum.
 notHelpfulTagsTiebreakMapping = {
   tag: priority for (priority, tag) in notHelpfulTagsAndTieBreakOrder
 }
 notHelpfulTagsEnumMapping = {
   tag: idx for (idx, (_, tag)) in enumerate(notHelpfulTagsAndTieBreakOrder)
 }
+# Categorical dtype whose codes are the TSV enum ids from notHelpfulTagsEnumMapping, so a
+# Series of tag names can be encoded with .astype(...).cat.codes instead of a per-row map.
+notHelpfulTagsCategoricalDtype = pd.CategoricalDtype(categories=notHelpfulTagsTSVOrder)
+# Tiebreak priority indexed by the TSV enum id from notHelpfulTagsEnumMapping.
+notHelpfulTagTiebreakByEnum = np.fromiter(
+  (priority for (priority, _) in notHelpfulTagsAndTieBreakOrder),
+  dtype=np.int8,
+  count=len(notHelpfulTagsAndTieBreakOrder),
+)
+notHelpfulTagsTiebreakArray = np.array(notHelpfulTagsAndTieBreakOrder, dtype=tagTiebreakDtype)
 adjustedSuffix = "Adjusted"
-notHelpfulTagsAdjustedColumns = [f"{column}{adjustedSuffix}" for column in notHelpfulTagsTSVOrder]
-notHelpfulTagsAdjustedTSVColumnsAndTypes = [
-  (tag, np.double) for tag in notHelpfulTagsAdjustedColumns
-]
 ratioSuffix = "Ratio"
+notHelpfulTagsAdjustedColumns = [
+  sys.intern(f"{column}{adjustedSuffix}") for column in notHelpfulTagsTSVOrder
+]
 notHelpfulTagsAdjustedRatioColumns = [
-  f"{column}{ratioSuffix}" for column in notHelpfulTagsAdjustedColumns
+  sys.intern(f"{column}{ratioSuffix}") for column in notHelpfulTagsAdjustedColumns
+]
+notHelpfulTagsAdjustedTSVColumnsAndTypes = [
+  (tag, _float64) for tag in notHelpfulTagsAdjustedColumns
 ]
 notHelpfulTagsAdjustedRatioTSVColumnsAndTypes = [
-  (tag, np.double) for tag in notHelpfulTagsAdjustedRatioColumns
+  (tag, _float64) for tag in notHelpfulTagsAdjustedRatioColumns
 ]
 ratingWeightKey = "ratingWeight"
 
@@ -377,18 +442,19 @@ lowDiligenceRaterInterceptKey = "lowDiligenceRaterIntercept"
 lowDiligenceRaterReputationKey = "lowDiligenceRaterReputation"
 lowDiligenceNoteFactor1Key = "lowDiligenceNoteFactor1"
 lowDiligenceNoteInterceptKey = "lowDiligenceNoteIntercept"
-lowDiligenceLegacyNoteInterceptKey = "lowDiligenceIntercept"
+# Legacy name for the same column as lowDiligenceInterceptKey.
+lowDiligenceLegacyNoteInterceptKey = lowDiligenceInterceptKey
 lowDiligenceNoteInterceptRound2Key = "lowDiligenceNoteInterceptRound2"
 internalNoteInterceptRound2Key = "internalNoteInterceptRound2"
 lowDiligenceRaterInterceptRound2Key = "lowDiligenceRaterInterceptRound2"
 internalRaterInterceptRound2Key = "internalRaterInterceptRound2"
 
 incorrectFilterColumnsAndTypes = [
-  (notHelpfulIncorrectIntervalKey, np.double),
-  (sumOfIncorrectTagRateByRaterIntervalKey, np.double),
-  (numVotersIntervalKey, np.double),
-  (noteTfIdfIncorrectScoreIntervalKey, np.double),
-  (lowDiligenceLegacyNoteInterceptKey, np.double),
+  (notHelpfulIncorrectIntervalKey, _float64),
+  (sumOfIncorrectTagRateByRaterIntervalKey, _float64),
+  (numVotersIntervalKey, _float64),
+  (noteTfIdfIncorrectScoreIntervalKey, _float64),
+  (lowDiligenceLegacyNoteInterceptKey, _float64),
 ]
 incorrectFilterColumns = [col for (col, _) in incorrectFilterColumnsAndTypes]
 
@@ -409,7 +475,7 @@ misleadingTags = [
   misleadingUnverifiedClaimAsFactKey,
   misleadingSatireKey,
 ]
-misleadingTagsAndTypes = [(tag, pd.Int8Dtype()) for tag in misleadingTags]
+misleadingTagsAndTypes = [(tag, _nullableInt8) for tag in misleadingTags]
 
 notMisleadingOtherKey = "notMisleadingOther"
 notMisleadingFactuallyCorrectKey = "notMisleadingFactuallyCorrect"
@@ -423,7 +489,7 @@ notMisleadingTags = [
   notMisleadingClearlySatireKey,
   notMisleadingPersonalOpinionKey,
 ]
-notMisleadingTagsAndTypes = [(tag, pd.Int8Dtype()) for tag in notMisleadingTags]
+notMisleadingTagsAndTypes = [(tag, _nullableInt8) for tag in notMisleadingTags]
 
 believableKey = "believable"
 harmfulKey = "harmful"
@@ -431,53 +497,55 @@ validationDifficultyKey = "validationDifficulty"
 trustworthySourcesKey = "trustworthySources"
 isMediaNoteKey = "isMediaNote"
 
-noteTSVColumnsAndTypes = (
-  [
-    (noteIdKey, np.int64),
-    (noteAuthorParticipantIdKey, object),
-    (createdAtMillisKey, np.int64),
-    (tweetIdKey, np.int64),
-    (classificationKey, object),
-    (believableKey, "category"),
-    (harmfulKey, "category"),
-    (validationDifficultyKey, "category"),
-  ]
-  + misleadingTagsAndTypes
-  + notMisleadingTagsAndTypes
-  + [
-    (trustworthySourcesKey, pd.Int8Dtype()),
-    (summaryKey, object),
-    (isMediaNoteKey, pd.Int8Dtype()),
-  ]
+noteTSVColumnsAndTypes = list(
+  chain(
+    [
+      (noteIdKey, _int64),
+      (noteAuthorParticipantIdKey, object),
+      (createdAtMillisKey, _int64),
+      (tweetIdKey, _int64),
+      (classificationKey, object),
+      (believableKey, "category"),
+      (harmfulKey, "category"),
+      (validationDifficultyKey, "category"),
+    ],
+    misleadingTagsAndTypes,
+    notMisleadingTagsAndTypes,
+    [
+      (trustworthySourcesKey, _nullableInt8),
+      (summaryKey, object),
+      (isMediaNoteKey, _nullableInt8),
+    ],
+  )
 )
-noteTSVColumns = [col for (col, dtype) in noteTSVColumnsAndTypes]
-noteTSVTypes = [dtype for (col, dtype) in noteTSVColumnsAndTypes]
-noteTSVTypeMapping = {col: dtype for (col, dtype) in noteTSVColumnsAndTypes}
+noteTSVColumns, noteTSVTypes, noteTSVTypeMapping = _split_columns_and_types(noteTSVColumnsAndTypes)
 
 versionKey = "version"
 agreeKey = "agree"
 disagreeKey = "disagree"
 ratedOnTweetIdKey = "ratedOnTweetId"
-ratingTSVColumnsAndTypes = (
-  [
-    (noteIdKey, np.int64),
-    (raterParticipantIdKey, object),
-    (createdAtMillisKey, np.int64),
-    (versionKey, pd.Int8Dtype()),
-    (agreeKey, pd.Int8Dtype()),
-    (disagreeKey, pd.Int8Dtype()),
-    (helpfulKey, pd.Int8Dtype()),
-    (notHelpfulKey, pd.Int8Dtype()),
-    (helpfulnessLevelKey, "category"),
-  ]
-  + helpfulTagBoolsAndTypesTSVOrder
-  + notHelpfulTagsAndTypesTSVOrder
-  + [(ratedOnTweetIdKey, np.int64)]
+ratingTSVColumnsAndTypes = list(
+  chain(
+    [
+      (noteIdKey, _int64),
+      (raterParticipantIdKey, object),
+      (createdAtMillisKey, _int64),
+      (versionKey, _nullableInt8),
+      (agreeKey, _nullableInt8),
+      (disagreeKey, _nullableInt8),
+      (helpfulKey, _nullableInt8),
+      (notHelpfulKey, _nullableInt8),
+      (helpfulnessLevelKey, "category"),
+    ],
+    helpfulTagBoolsAndTypesTSVOrder,
+    notHelpfulTagsAndTypesTSVOrder,
+    [(ratedOnTweetIdKey, _int64)],
+  )
 )
 
-ratingTSVColumns = [col for (col, dtype) in ratingTSVColumnsAndTypes]
-ratingTSVTypes = [dtype for (col, dtype) in ratingTSVColumnsAndTypes]
-ratingTSVTypeMapping = {col: dtype for (col, dtype) in ratingTSVColumnsAndTypes}
+ratingTSVColumns, ratingTSVTypes, ratingTSVTypeMapping = _split_columns_and_types(
+  ratingTSVColumnsAndTypes
+)
 
 timestampMillisOfNoteFirstNonNMRLabelKey = "timestampMillisOfFirstNonNMRStatus"
 firstNonNMRLabelKey = "firstNonNMRStatus"
@@ -504,41 +572,39 @@ timestampMinuteOfFinalScoringOutput = "timestampMinuteOfFinalScoringOutput"
 timestampMillisOfFirstNmrDueToMinStableCrhTimeKey = "timestampMillisOfFirstNmrDueToMinStableCrhTime"
 
 noteStatusHistoryTSVColumnsAndTypes = [
-  (noteIdKey, np.int64),
+  (noteIdKey, _int64),
   (noteAuthorParticipantIdKey, object),
-  (createdAtMillisKey, np.int64),
-  (timestampMillisOfNoteFirstNonNMRLabelKey, np.double),  # double because nullable.
+  (createdAtMillisKey, _int64),
+  (timestampMillisOfNoteFirstNonNMRLabelKey, _float64),  # double because nullable.
   (firstNonNMRLabelKey, "category"),
-  (timestampMillisOfNoteCurrentLabelKey, np.double),  # double because nullable.
+  (timestampMillisOfNoteCurrentLabelKey, _float64),  # double because nullable.
   (currentLabelKey, "category"),
-  (timestampMillisOfNoteMostRecentNonNMRLabelKey, np.double),  # double because nullable.
+  (timestampMillisOfNoteMostRecentNonNMRLabelKey, _float64),  # double because nullable.
   (mostRecentNonNMRLabelKey, "category"),
-  (timestampMillisOfStatusLockKey, np.double),  # double because nullable.
+  (timestampMillisOfStatusLockKey, _float64),  # double because nullable.
   (lockedStatusKey, "category"),
-  (timestampMillisOfRetroLockKey, np.double),  # double because nullable.
+  (timestampMillisOfRetroLockKey, _float64),  # double because nullable.
   (currentCoreStatusKey, "category"),
   (currentExpansionStatusKey, "category"),
   (currentGroupStatusKey, "category"),
   (currentDecidedByKey, "category"),
-  (currentModelingGroupKey, np.double),  # TODO: int
-  (timestampMillisOfMostRecentStatusChangeKey, np.double),  # double because nullable.
-  (timestampMillisOfNmrDueToMinStableCrhTimeKey, np.double),  # double because nullable.
+  (currentModelingGroupKey, _float64),  # TODO: int
+  (timestampMillisOfMostRecentStatusChangeKey, _float64),  # double because nullable.
+  (timestampMillisOfNmrDueToMinStableCrhTimeKey, _float64),  # double because nullable.
   (currentMultiGroupStatusKey, "category"),
-  (currentModelingMultiGroupKey, np.double),  # TODO: int
-  (timestampMinuteOfFinalScoringOutput, np.double),  # double because nullable.
-  (timestampMillisOfFirstNmrDueToMinStableCrhTimeKey, np.double),  # double because nullable.
+  (currentModelingMultiGroupKey, _float64),  # TODO: int
+  (timestampMinuteOfFinalScoringOutput, _float64),  # double because nullable.
+  (timestampMillisOfFirstNmrDueToMinStableCrhTimeKey, _float64),  # double because nullable.
 ]
-noteStatusHistoryTSVColumns = [col for (col, dtype) in noteStatusHistoryTSVColumnsAndTypes]
-noteStatusHistoryTSVTypes = [dtype for (col, dtype) in noteStatusHistoryTSVColumnsAndTypes]
-noteStatusHistoryTSVTypeMapping = {
-  col: dtype for (col, dtype) in noteStatusHistoryTSVColumnsAndTypes
-}
+(
+  noteStatusHistoryTSVColumns,
+  noteStatusHistoryTSVTypes,
+  noteStatusHistoryTSVTypeMapping,
+) = _split_columns_and_types(noteStatusHistoryTSVColumnsAndTypes)
 # TODO(jiansongc): clean up after new column is in production.
 noteStatusHistoryTSVColumnsOld = noteStatusHistoryTSVColumns[:-1]
 noteStatusHistoryTSVColumnsAndTypesOld = noteStatusHistoryTSVColumnsAndTypes[:-1]
-noteStatusHistoryTSVTypeMappingOld = {
-  col: dtype for (col, dtype) in noteStatusHistoryTSVColumnsAndTypesOld
-}
+noteStatusHistoryTSVTypeMappingOld = dict(noteStatusHistoryTSVColumnsAndTypesOld)
 
 
 # Earn In + Earn Out
@@ -566,6 +632,10 @@ enrollmentStateToThrift = {
   newUser: 4,
   removed: 5,
 }
+# Categorical dtype whose codes match enrollmentStateToThrift, for vectorized encoding.
+enrollmentStateCategories = pd.CategoricalDtype(
+  categories=sorted(enrollmentStateToThrift, key=enrollmentStateToThrift.get), ordered=True
+)
 emergingWriterDays = 28
 isEmergingWriterKey = "isEmergingWriter"
 emergingMeanNoteScore = 0.3
@@ -581,76 +651,77 @@ hasCrnhSinceEarnOut = "hasCrnhSinceEarnOut"
 userEnrollmentTSVColumnsAndTypes = [
   (participantIdKey, str),
   (enrollmentState, str),
-  (successfulRatingNeededToEarnIn, np.int64),
-  (timestampOfLastStateChange, np.int64),
-  (timestampOfLastEarnOut, np.double),  # double because nullable.
+  (successfulRatingNeededToEarnIn, _int64),
+  (timestampOfLastStateChange, _int64),
+  (timestampOfLastEarnOut, _float64),  # double because nullable.
   (modelingPopulationKey, "category"),
-  (modelingGroupKey, np.float64),
-  (numberOfTimesEarnedOutKey, np.int64),
+  (modelingGroupKey, _float64),
+  (numberOfTimesEarnedOutKey, _int64),
 ]
-userEnrollmentTSVColumns = [col for (col, _) in userEnrollmentTSVColumnsAndTypes]
-userEnrollmentTSVTypes = [dtype for (_, dtype) in userEnrollmentTSVColumnsAndTypes]
-userEnrollmentTSVTypeMapping = {col: dtype for (col, dtype) in userEnrollmentTSVColumnsAndTypes}
+(
+  userEnrollmentTSVColumns,
+  userEnrollmentTSVTypes,
+  userEnrollmentTSVTypeMapping,
+) = _split_columns_and_types(userEnrollmentTSVColumnsAndTypes)
 
 noteInterceptMaxKey = "internalNoteIntercept_max"
 noteInterceptMinKey = "internalNoteIntercept_min"
 noteParameterUncertaintyTSVMainColumnsAndTypes = [
-  (noteInterceptMaxKey, np.double),
-  (noteInterceptMinKey, np.double),
+  (noteInterceptMaxKey, _float64),
+  (noteInterceptMinKey, _float64),
 ]
 noteParameterUncertaintyTSVAuxColumnsAndTypes = [
-  ("internalNoteFactor1_max", np.double),
-  ("internalNoteFactor1_median", np.double),
-  ("internalNoteFactor1_min", np.double),
-  ("internalNoteFactor1_refit_orig", np.double),
-  ("internalNoteIntercept_median", np.double),
-  ("internalNoteIntercept_refit_orig", np.double),
-  ("ratingCount_all", np.int64),
-  ("ratingCount_neg_fac", np.int64),
-  ("ratingCount_pos_fac", np.int64),
+  ("internalNoteFactor1_max", _float64),
+  ("internalNoteFactor1_median", _float64),
+  ("internalNoteFactor1_min", _float64),
+  ("internalNoteFactor1_refit_orig", _float64),
+  ("internalNoteIntercept_median", _float64),
+  ("internalNoteIntercept_refit_orig", _float64),
+  ("ratingCount_all", _int64),
+  ("ratingCount_neg_fac", _int64),
+  ("ratingCount_pos_fac", _int64),
 ]
 noteParameterUncertaintyTSVColumnsAndTypes = (
   noteParameterUncertaintyTSVAuxColumnsAndTypes + noteParameterUncertaintyTSVMainColumnsAndTypes
 )
-noteParameterUncertaintyTSVColumns = [
-  col for (col, _) in noteParameterUncertaintyTSVColumnsAndTypes
-]
 noteParameterUncertaintyTSVAuxColumns = [
   col for (col, _) in noteParameterUncertaintyTSVAuxColumnsAndTypes
 ]
 noteParameterUncertaintyTSVMainColumns = [
   col for (col, _) in noteParameterUncertaintyTSVMainColumnsAndTypes
 ]
-noteParameterUncertaintyTSVTypes = [
-  dtype for (_, dtype) in noteParameterUncertaintyTSVColumnsAndTypes
-]
-noteParameterUncertaintyTSVTypeMapping = {
-  col: dtype for (col, dtype) in noteParameterUncertaintyTSVColumnsAndTypes
-}
-
-auxiliaryScoredNotesTSVColumnsAndTypes = (
-  [
-    (noteIdKey, np.int64),
-    (ratingWeightKey, np.double),
-    (createdAtMillisKey, np.int64),
-    (noteAuthorParticipantIdKey, object),
-    (awaitingMoreRatingsBoolKey, np.int8),
-    (numRatingsLast28DaysKey, np.int64),
-    (currentLabelKey, str),
-    (currentlyRatedHelpfulBoolKey, np.int8),
-    (currentlyRatedNotHelpfulBoolKey, np.int8),
-    (unlockedRatingStatusKey, str),
-  ]
-  + helpfulTagCountsAndTypesTSVOrder
-  + notHelpfulTagCountsAndTypesTSVOrder
-  + notHelpfulTagsAdjustedTSVColumnsAndTypes
-  + notHelpfulTagsAdjustedRatioTSVColumnsAndTypes
-  + incorrectFilterColumnsAndTypes
+(
+  noteParameterUncertaintyTSVColumns,
+  noteParameterUncertaintyTSVTypes,
+  noteParameterUncertaintyTSVTypeMapping,
+) = _split_columns_and_types(noteParameterUncertaintyTSVColumnsAndTypes)
+
+auxiliaryScoredNotesTSVColumnsAndTypes = list(
+  chain(
+    [
+      (noteIdKey, _int64),
+      (ratingWeightKey, _float64),
+      (createdAtMillisKey, _int64),
+      (noteAuthorParticipantIdKey, object),
+      (awaitingMoreRatingsBoolKey, _int8),
+      (numRatingsLast28DaysKey, _int64),
+      (currentLabelKey, str),
+      (currentlyRatedHelpfulBoolKey, _int8),
+      (currentlyRatedNotHelpfulBoolKey, _int8),
+      (unlockedRatingStatusKey, str),
+    ],
+    helpfulTagCountsAndTypesTSVOrder,
+    notHelpfulTagCountsAndTypesTSVOrder,
+    notHelpfulTagsAdjustedTSVColumnsAndTypes,
+    notHelpfulTagsAdjustedRatioTSVColumnsAndTypes,
+    incorrectFilterColumnsAndTypes,
+  )
 )
-auxiliaryScoredNotesTSVColumns = [col for (col, dtype) in auxiliaryScoredNotesTSVColumnsAndTypes]
-auxiliaryScoredNotesTSVTypeMapping = {
-  col: dtype for (col, dtype) in auxiliaryScoredNotesTSVColumnsAndTypes
-}
+(
+  auxiliaryScoredNotesTSVColumns,
+  auxiliaryScoredNotesTSVTypes,
+  auxiliaryScoredNotesTSVTypeMapping,
+) = _split_columns_and_types(auxiliaryScoredNotesTSVColumnsAndTypes)
 
 deprecatedNoteModelOutputColumns = frozenset(
   {
@@ -661,194 +732,9 @@ deprecatedNoteModelOutputColumns = frozenset(
   }
 )
 
-prescoringNoteModelOutputTSVColumnsAndTypes = [
-  (noteIdKey, np.int64),
-  (internalNoteInterceptKey, np.double),
-  (internalNoteFactor1Key, np.double),
-  (scorerNameKey, str),
-  (lowDiligenceNoteInterceptKey, np.double),
-  (lowDiligenceNoteFactor1Key, np.double),
-  (lowDiligenceNoteInterceptRound2Key, np.double),
-]
-prescoringNoteModelOutputTSVColumns = [
-  col for (col, dtype) in prescoringNoteModelOutputTSVColumnsAndTypes
-]
-prescoringNoteModelOutputTSVTypeMapping = {
-  col: dtype for (col, dtype) in prescoringNoteModelOutputTSVColumnsAndTypes
-}
-
-noteModelOutputTSVColumnsAndTypes = [
-  (noteIdKey, np.int64),
-  (coreNoteInterceptKey, np.double),
-  (coreNoteFactor1Key, np.double),
-  (finalRatingStatusKey, "category"),
-  (firstTagKey, "category"),
-  (secondTagKey, "category"),
-  # Note that this column was formerly named "activeRules" and the name is now
-  # updated to "coreActiveRules".  The data values remain the compatible,
-  # but the new column only contains rules that ran when deciding status based on
-  # the core model.
-  (coreActiveRulesKey, "category"),
-  (activeFilterTagsKey, "category"),
-  (classificationKey, "category"),
-  (createdAtMillisKey, np.int64),
-  (coreRatingStatusKey, "category"),
-  (metaScorerActiveRulesKey, "category"),
-  (decidedByKey, "category"),
-  (expansionNoteInterceptKey, np.double),
-  (expansionNoteFactor1Key, np.double),
-  (expansionRatingStatusKey, "category"),
-  (coverageNoteInterceptKey, np.double),
-  (coverageNoteFactor1Key, np.double),
-  (coverageRatingStatusKey, "category"),
-  (coreNoteInterceptMinKey, np.double),
-  (coreNoteInterceptMaxKey, np.double),
-  (expansionNoteInterceptMinKey, "category"),  # category because always nan
-  (expansionNoteInterceptMaxKey, "category"),  # category because always nan
-  (coverageNoteInterceptMinKey, "category"),  # category because always nan
-  (coverageNoteInterceptMaxKey, "category"),  # category because always nan
-  (groupNoteInterceptKey, np.double),
-  (groupNoteFactor1Key, np.double),
-  (groupRatingStatusKey, "category"),
-  (groupNoteInterceptMaxKey, "category"),  # category because always nan
-  (groupNoteInterceptMinKey, "category"),  # category because always nan
-  (modelingGroupKey, np.float64),
-  (numRatingsKey, np.int64),
-  (timestampMillisOfNoteCurrentLabelKey, np.double),
-  (expansionPlusNoteInterceptKey, np.double),
-  (expansionPlusNoteFactor1Key, np.double),
-  (expansionPlusRatingStatusKey, "category"),
-  (topicNoteInterceptKey, np.double),
-  (topicNoteFactor1Key, np.double),
-  (topicRatingStatusKey, "category"),
-  (noteTopicKey, "category"),
-  (topicNoteConfidentKey, pd.BooleanDtype()),
-  (expansionInternalActiveRulesKey, "category"),
-  (expansionPlusInternalActiveRulesKey, "category"),
-  (groupInternalActiveRulesKey, "category"),
-  (topicInternalActiveRulesKey, "category"),
-  (coreNumFinalRoundRatingsKey, np.double),  # double because nullable.
-  (expansionNumFinalRoundRatingsKey, np.double),  # double because nullable.
-  (expansionPlusNumFinalRoundRatingsKey, np.double),  # double because nullable.
-  (groupNumFinalRoundRatingsKey, np.double),  # double because nullable.
-  (topicNumFinalRoundRatingsKey, np.double),  # double because nullable.
-  (rescoringActiveRulesKey, "category"),
-  (multiGroupNoteInterceptKey, np.double),
-  (multiGroupNoteFactor1Key, np.double),
-  (multiGroupRatingStatusKey, str),
-  (modelingMultiGroupKey, np.float64),
-  (multiGroupInternalActiveRulesKey, str),
-  (multiGroupNumFinalRoundRatingsKey, np.double),  # double because nullable.
-]
-noteModelOutputTSVColumns = [col for (col, dtype) in noteModelOutputTSVColumnsAndTypes]
-noteModelOutputTSVTypeMapping = {col: dtype for (col, dtype) in noteModelOutputTSVColumnsAndTypes}
-deprecatedNoteModelOutputTSVColumnsAndTypes = [
-  (col, dtype)
-  for (col, dtype) in noteModelOutputTSVColumnsAndTypes
-  if col in deprecatedNoteModelOutputColumns
-]
-
 postSelectionValueKey = "postSelectionValue"
 
-prescoringRaterModelOutputTSVColumnsAndTypes = [
-  (raterParticipantIdKey, object),
-  (internalRaterInterceptKey, np.double),
-  (internalRaterFactor1Key, np.double),
-  (crhCrnhRatioDifferenceKey, np.double),
-  (meanNoteScoreKey, np.double),
-  (raterAgreeRatioKey, np.double),
-  (aboveHelpfulnessThresholdKey, pd.BooleanDtype()),
-  (scorerNameKey, str),
-  (internalRaterReputationKey, np.double),
-  (lowDiligenceRaterInterceptKey, np.double),
-  (lowDiligenceRaterFactor1Key, np.double),
-  (lowDiligenceRaterReputationKey, np.double),
-  (lowDiligenceRaterInterceptRound2Key, np.double),
-  (incorrectTagRatingsMadeByRaterKey, pd.Int64Dtype()),
-  (totalRatingsMadeByRaterKey, pd.Int64Dtype()),
-  (postSelectionValueKey, pd.Int64Dtype()),
-]
-prescoringRaterModelOutputTSVColumns = [
-  col for (col, dtype) in prescoringRaterModelOutputTSVColumnsAndTypes
-]
-prescoringRaterModelOutputTSVTypeMapping = {
-  col: dtype for (col, dtype) in prescoringRaterModelOutputTSVColumnsAndTypes
-}
-
-raterModelOutputTSVColumnsAndTypes = [
-  (raterParticipantIdKey, np.int64),
-  (coreRaterInterceptKey, np.double),
-  (coreRaterFactor1Key, np.double),
-  (crhCrnhRatioDifferenceKey, np.double),
-  (meanNoteScoreKey, np.double),
-  (raterAgreeRatioKey, np.double),
-  (successfulRatingHelpfulCount, pd.Int64Dtype()),
-  (successfulRatingNotHelpfulCount, pd.Int64Dtype()),
-  (successfulRatingTotal, pd.Int64Dtype()),
-  (unsuccessfulRatingHelpfulCount, pd.Int64Dtype()),
-  (unsuccessfulRatingNotHelpfulCount, pd.Int64Dtype()),
-  (unsuccessfulRatingTotal, pd.Int64Dtype()),
-  (ratingsAwaitingMoreRatings, pd.Int64Dtype()),
-  (ratedAfterDecision, pd.Int64Dtype()),
-  (notesCurrentlyRatedHelpful, pd.Int64Dtype()),
-  (notesCurrentlyRatedNotHelpful, pd.Int64Dtype()),
-  (notesAwaitingMoreRatings, pd.Int64Dtype()),
-  (enrollmentState, pd.Int64Dtype()),
-  (successfulRatingNeededToEarnIn, pd.Int64Dtype()),
-  (authorTopNotHelpfulTagValues, str),
-  (timestampOfLastStateChange, np.double),
-  (aboveHelpfulnessThresholdKey, np.float64),  # nullable bool.
-  (isEmergingWriterKey, pd.BooleanDtype()),
-  (aggregateRatingReceivedTotal, pd.Int64Dtype()),
-  (timestampOfLastEarnOut, np.double),
-  (groupRaterInterceptKey, np.double),
-  (groupRaterFactor1Key, np.double),
-  (modelingGroupKey, np.float64),
-  (raterHelpfulnessReputationKey, np.double),
-  (numberOfTimesEarnedOutKey, np.float64),
-  (expansionRaterInterceptKey, np.double),
-  (expansionRaterFactor1Key, np.double),
-  (expansionPlusRaterInterceptKey, np.double),
-  (expansionPlusRaterFactor1Key, np.double),
-  (multiGroupRaterInterceptKey, np.double),
-  (multiGroupRaterFactor1Key, np.double),
-  (modelingMultiGroupKey, np.float64),
-]
-raterModelOutputTSVColumns = [col for (col, dtype) in raterModelOutputTSVColumnsAndTypes]
-raterModelOutputTSVTypeMapping = {col: dtype for (col, dtype) in raterModelOutputTSVColumnsAndTypes}
-
 noteStatusChangesPrev = "_prev"
-noteStatusChangesDerivedColumnsAndTypes = [
-  (noteIdKey, np.int64),
-  (noteFinalStatusChange, str),
-  (noteNewRatings, np.int64),
-  (noteDecidedByChange, str),
-  (noteAllAddedRules, str),
-  (noteAllRemovedRules, str),
-  (noteDecidedByInterceptChange, str),
-]
-noteStatusChangesRemovedCols = [
-  col
-  for col in noteModelOutputTSVColumns
-  if ("NoteInterceptMin" in col) or ("NoteInterceptMax" in col)
-]
-noteStatusChangesModelOutputColumnsAndTypes = [
-  (col, t)
-  for (col, t) in noteModelOutputTSVColumnsAndTypes
-  if col not in noteStatusChangesRemovedCols + [noteIdKey]
-]
-noteStatusChangesModelOutputWithPreviousColumnsAndTypes = (
-  noteStatusChangesModelOutputColumnsAndTypes
-  + [(col + noteStatusChangesPrev, t) for (col, t) in noteStatusChangesModelOutputColumnsAndTypes]
-)
-
-noteStatusChangeTSVColumnsAndTypes = noteStatusChangesDerivedColumnsAndTypes + sorted(
-  noteStatusChangesModelOutputWithPreviousColumnsAndTypes, key=lambda tup: tup[0]
-)
-noteStatusChangesTSVColumns = [col for (col, dtype) in noteStatusChangeTSVColumnsAndTypes]
-noteStatusChangesTSVTypeMapping = {
-  col: dtype for (col, dtype) in noteStatusChangeTSVColumnsAndTypes
-}
 
 datasetKeyKey = "datasetKey"
 partitionToReadKey = "partitionToRead"
@@ -858,18 +744,314 @@ inputPathsTSVColumnsAndTypes = [
   (partitionToReadKey, str),
   (fileNameToReadKey, str),
 ]
-inputPathsTSVColumns = [col for (col, _) in inputPathsTSVColumnsAndTypes]
-inputPathsTSVTypeMapping = {col: dtype for (col, dtype) in inputPathsTSVColumnsAndTypes}
+inputPathsTSVColumns, inputPathsTSVTypes, inputPathsTSVTypeMapping = _split_columns_and_types(
+  inputPathsTSVColumnsAndTypes
+)
+
+# Intern all string constants defined above so that column names used as dict keys and
+# DataFrame labels compare by identity.  Identifier-like literals are already interned by
+# the compiler; this also covers names assembled at import time.
+for _name, _value in list(globals().items()):
+  if isinstance(_value, str) and not _name.startswith("_"):
+    globals()[_name] = sys.intern(_value)
+del _name, _value
+
+
+# Some module attributes are built on first access through the module __getattr__
+# (PEP 562) rather than at import.  Each builder returns its local namespace, and the
+# registered names are then cached as module globals.
+_lazyAttributeBuilders = {}
+
+
+def _lazy_attributes(*names):
+  def register(builder):
+    for name in names:
+      _lazyAttributeBuilders[name] = (builder, names)
+    return builder
+
+  return register
+
+
+def _get_lazy_attribute(name):
+  if name not in globals():
+    builder, names = _lazyAttributeBuilders[name]
+    namespace = builder()
+    for builtName in names:
+      # Don't clobber a sibling name that was already assigned (e.g. overridden by a caller).
+      globals().setdefault(builtName, namespace[builtName])
+  return globals()[name]
+
+
+def __getattr__(name):
+  if name in _lazyAttributeBuilders:
+    return _get_lazy_attribute(name)
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+  return sorted(set(globals()) | set(_lazyAttributeBuilders))
+
+
+# Default number of threads to use in torch if no value is specified.
+@_lazy_attributes("defaultNumThreads")
+def _build_default_num_threads():
+  defaultNumThreads = default_num_threads()
+  return locals()
+
+
+# The model output and note status change schemas are only needed when reading or writing
+# those files.
+@_lazy_attributes(
+  "prescoringNoteModelOutputTSVColumnsAndTypes",
+  "prescoringNoteModelOutputTSVColumns",
+  "prescoringNoteModelOutputTSVTypes",
+  "prescoringNoteModelOutputTSVTypeMapping",
+)
+def _build_prescoring_note_model_output_schema():
+  prescoringNoteModelOutputTSVColumnsAndTypes = [
+    (noteIdKey, _int64),
+    (internalNoteInterceptKey, _float64),
+    (internalNoteFactor1Key, _float64),
+    (scorerNameKey, str),
+    (lowDiligenceNoteInterceptKey, _float64),
+    (lowDiligenceNoteFactor1Key, _float64),
+    (lowDiligenceNoteInterceptRound2Key, _float64),
+  ]
+  (
+    prescoringNoteModelOutputTSVColumns,
+    prescoringNoteModelOutputTSVTypes,
+    prescoringNoteModelOutputTSVTypeMapping,
+  ) = _split_columns_and_types(prescoringNoteModelOutputTSVColumnsAndTypes)
+  return locals()
+
+
+@_lazy_attributes(
+  "noteModelOutputTSVColumnsAndTypes",
+  "noteModelOutputTSVColumns",
+  "noteModelOutputTSVTypes",
+  "noteModelOutputTSVTypeMapping",
+  "deprecatedNoteModelOutputTSVColumnsAndTypes",
+)
+def _build_note_model_output_schema():
+  noteModelOutputTSVColumnsAndTypes = [
+    (noteIdKey, _int64),
+    (coreNoteInterceptKey, _float64),
+    (coreNoteFactor1Key, _float64),
+    (finalRatingStatusKey, "category"),
+    (firstTagKey, "category"),
+    (secondTagKey, "category"),
+    # Note that this column was formerly named "activeRules" and the name is now
+    # updated to "coreActiveRules".  The data values remain the compatible,
+    # but the new column only contains rules that ran when deciding status based on
+    # the core model.
+    (coreActiveRulesKey, "category"),
+    (activeFilterTagsKey, "category"),
+    (classificationKey, "category"),
+    (createdAtMillisKey, _int64),
+    (coreRatingStatusKey, "category"),
+    (metaScorerActiveRulesKey, "category"),
+    (decidedByKey, "category"),
+    (expansionNoteInterceptKey, _float64),
+    (expansionNoteFactor1Key, _float64),
+    (expansionRatingStatusKey, "category"),
+    (coverageNoteInterceptKey, _float64),
+    (coverageNoteFactor1Key, _float64),
+    (coverageRatingStatusKey, "category"),
+    (coreNoteInterceptMinKey, _float64),
+    (coreNoteInterceptMaxKey, _float64),
+    (expansionNoteInterceptMinKey, "category"),  # category because always nan
+    (expansionNoteInterceptMaxKey, "category"),  # category because always nan
+    (coverageNoteInterceptMinKey, "category"),  # category because always nan
+    (coverageNoteInterceptMaxKey, "category"),  # category because always nan
+    (groupNoteInterceptKey, _float64),
+    (groupNoteFactor1Key, _float64),
+    (groupRatingStatusKey, "category"),
+    (groupNoteInterceptMaxKey, "category"),  # category because always nan
+    (groupNoteInterceptMinKey, "category"),  # category because always nan
+    (modelingGroupKey, _float64),
+    (numRatingsKey, _int64),
+    (timestampMillisOfNoteCurrentLabelKey, _float64),
+    (expansionPlusNoteInterceptKey, _float64),
+    (expansionPlusNoteFactor1Key, _float64),
+    (expansionPlusRatingStatusKey, "category"),
+    (topicNoteInterceptKey, _float64),
+    (topicNoteFactor1Key, _float64),
+    (topicRatingStatusKey, "category"),
+    (noteTopicKey, "category"),
+    (topicNoteConfidentKey, _nullableBoolean),
+    (expansionInternalActiveRulesKey, "category"),
+    (expansionPlusInternalActiveRulesKey, "category"),
+    (groupInternalActiveRulesKey, "category"),
+    (topicInternalActiveRulesKey, "category"),
+    (coreNumFinalRoundRatingsKey, _float64),  # double because nullable.
+    (expansionNumFinalRoundRatingsKey, _float64),  # double because nullable.
+    (expansionPlusNumFinalRoundRatingsKey, _float64),  # double because nullable.
+    (groupNumFinalRoundRatingsKey, _float64),  # double because nullable.
+    (topicNumFinalRoundRatingsKey, _float64),  # double because nullable.
+    (rescoringActiveRulesKey, "category"),
+    (multiGroupNoteInterceptKey, _float64),
+    (multiGroupNoteFactor1Key, _float64),
+    (multiGroupRatingStatusKey, str),
+    (modelingMultiGroupKey, _float64),
+    (multiGroupInternalActiveRulesKey, str),
+    (multiGroupNumFinalRoundRatingsKey, _float64),  # double because nullable.
+  ]
+  (
+    noteModelOutputTSVColumns,
+    noteModelOutputTSVTypes,
+    noteModelOutputTSVTypeMapping,
+  ) = _split_columns_and_types(noteModelOutputTSVColumnsAndTypes)
+  deprecatedNoteModelOutputTSVColumnsAndTypes = [
+    (col, dtype)
+    for (col, dtype) in noteModelOutputTSVColumnsAndTypes
+    if col in deprecatedNoteModelOutputColumns
+  ]
+  return locals()
+
+
+@_lazy_attributes(
+  "prescoringRaterModelOutputTSVColumnsAndTypes",
+  "prescoringRaterModelOutputTSVColumns",
+  "prescoringRaterModelOutputTSVTypes",
+  "prescoringRaterModelOutputTSVTypeMapping",
+)
+def _build_prescoring_rater_model_output_schema():
+  prescoringRaterModelOutputTSVColumnsAndTypes = [
+    (raterParticipantIdKey, object),
+    (internalRaterInterceptKey, _float64),
+    (internalRaterFactor1Key, _float64),
+    (crhCrnhRatioDifferenceKey, _float64),
+    (meanNoteScoreKey, _float64),
+    (raterAgreeRatioKey, _float64),
+    (aboveHelpfulnessThresholdKey, _nullableBoolean),
+    (scorerNameKey, str),
+    (internalRaterReputationKey, _float64),
+    (lowDiligenceRaterInterceptKey, _float64),
+    (lowDiligenceRaterFactor1Key, _float64),
+    (lowDiligenceRaterReputationKey, _float64),
+    (lowDiligenceRaterInterceptRound2Key, _float64),
+    (incorrectTagRatingsMadeByRaterKey, _nullableInt64),
+    (totalRatingsMadeByRaterKey, _nullableInt64),
+    (postSelectionValueKey, _nullableInt64),
+  ]
+  (
+    prescoringRaterModelOutputTSVColumns,
+    prescoringRaterModelOutputTSVTypes,
+    prescoringRaterModelOutputTSVTypeMapping,
+  ) = _split_columns_and_types(prescoringRaterModelOutputTSVColumnsAndTypes)
+  return locals()
+
+
+@_lazy_attributes(
+  "raterModelOutputTSVColumnsAndTypes",
+  "raterModelOutputTSVColumns",
+  "raterModelOutputTSVTypes",
+  "raterModelOutputTSVTypeMapping",
+)
+def _build_rater_model_output_schema():
+  raterModelOutputTSVColumnsAndTypes = [
+    (raterParticipantIdKey, _int64),
+    (coreRaterInterceptKey, _float64),
+    (coreRaterFactor1Key, _float64),
+    (crhCrnhRatioDifferenceKey, _float64),
+    (meanNoteScoreKey, _float64),
+    (raterAgreeRatioKey, _float64),
+    (successfulRatingHelpfulCount, _nullableInt64),
+    (successfulRatingNotHelpfulCount, _nullableInt64),
+    (successfulRatingTotal, _nullableInt64),
+    (unsuccessfulRatingHelpfulCount, _nullableInt64),
+    (unsuccessfulRatingNotHelpfulCount, _nullableInt64),
+    (unsuccessfulRatingTotal, _nullableInt64),
+    (ratingsAwaitingMoreRatings, _nullableInt64),
+    (ratedAfterDecision, _nullableInt64),
+    (notesCurrentlyRatedHelpful, _nullableInt64),
+    (notesCurrentlyRatedNotHelpful, _nullableInt64),
+    (notesAwaitingMoreRatings, _nullableInt64),
+    (enrollmentState, _nullableInt64),
+    (successfulRatingNeededToEarnIn, _nullableInt64),
+    (authorTopNotHelpfulTagValues, str),
+    (timestampOfLastStateChange, _float64),
+    (aboveHelpfulnessThresholdKey, _float64),  # nullable bool.
+    (isEmergingWriterKey, _nullableBoolean),
+    (aggregateRatingReceivedTotal, _nullableInt64),
+    (timestampOfLastEarnOut, _float64),
+    (groupRaterInterceptKey, _float64),
+    (groupRaterFactor1Key, _float64),
+    (modelingGroupKey, _float64),
+    (raterHelpfulnessReputationKey, _float64),
+    (numberOfTimesEarnedOutKey, _float64),
+    (expansionRaterInterceptKey, _float64),
+    (expansionRaterFactor1Key, _float64),
+    (expansionPlusRaterInterceptKey, _float64),
+    (expansionPlusRaterFactor1Key, _float64),
+    (multiGroupRaterInterceptKey, _float64),
+    (multiGroupRaterFactor1Key, _float64),
+    (modelingMultiGroupKey, _float64),
+  ]
+  (
+    raterModelOutputTSVColumns,
+    raterModelOutputTSVTypes,
+    raterModelOutputTSVTypeMapping,
+  ) = _split_columns_and_types(raterModelOutputTSVColumnsAndTypes)
+  return locals()
+
+
+@_lazy_attributes(
+  "noteStatusChangesDerivedColumnsAndTypes",
+  "noteStatusChangesRemovedCols",
+  "noteStatusChangesModelOutputColumnsAndTypes",
+  "noteStatusChangesModelOutputWithPreviousColumnsAndTypes",
+  "noteStatusChangeTSVColumnsAndTypes",
+  "noteStatusChangesTSVColumns",
+  "noteStatusChangesTSVTypes",
+  "noteStatusChangesTSVTypeMapping",
+)
+def _build_note_status_changes_schema():
+  noteStatusChangesDerivedColumnsAndTypes = [
+    (noteIdKey, _int64),
+    (noteFinalStatusChange, str),
+    (noteNewRatings, _int64),
+    (noteDecidedByChange, str),
+    (noteAllAddedRules, str),
+    (noteAllRemovedRules, str),
+    (noteDecidedByInterceptChange, str),
+  ]
+  noteStatusChangesRemovedCols = [
+    col
+    for col in _get_lazy_attribute("noteModelOutputTSVColumns")
+    if col.endswith(("NoteInterceptMin", "NoteInterceptMax"))
+  ]
+  excludedCols = frozenset(noteStatusChangesRemovedCols) | {noteIdKey}
+  noteStatusChangesModelOutputColumnsAndTypes = [
+    (col, t)
+    for (col, t) in _get_lazy_attribute("noteModelOutputTSVColumnsAndTypes")
+    if col not in excludedCols
+  ]
+  noteStatusChangesModelOutputWithPreviousColumnsAndTypes = (
+    noteStatusChangesModelOutputColumnsAndTypes
+    + [(col + noteStatusChangesPrev, t) for (col, t) in noteStatusChangesModelOutputColumnsAndTypes]
+  )
+
+  noteStatusChangeTSVColumnsAndTypes = noteStatusChangesDerivedColumnsAndTypes + sorted(
+    noteStatusChangesModelOutputWithPreviousColumnsAndTypes, key=operator.itemgetter(0)
+  )
+  (
+    noteStatusChangesTSVColumns,
+    noteStatusChangesTSVTypes,
+    noteStatusChangesTSVTypeMapping,
+  ) = _split_columns_and_types(noteStatusChangeTSVColumnsAndTypes)
+  return locals()
 
 
 @contextmanager
 def time_block(label):
-  start = time.time()
+  start = time.perf_counter_ns()
   try:
     yield
   finally:
-    end = time.time()
-    logger.info(f"{label} elapsed time: {end - start:.2f} secs ({((end - start) / 60.0):.2f} mins)")
+    if logger.isEnabledFor(logging.INFO):
+      elapsed = (time.perf_counter_ns() - start) / 1e9
+      logger.info(f"{label} elapsed time: {elapsed:.2f} secs ({(elapsed / 60.0):.2f} mins)")
 
 
 ### TODO: weave through second round intercept.
@@ -894,14 +1076,36 @@ class PrescoringMetaScorerOutput:
 class PrescoringMetaOutput:
   metaScorerOutput: Dict[str, PrescoringMetaScorerOutput]  # scorerName => output
 
-
-@dataclass
+  def intern_names(self) -> "PrescoringMetaOutput":
+    """Re-key scorer outputs and tag thresholds on interned names, in place.
+
+    Outputs unpickled from scorer processes or from disk each carry private copies of the
+    scorer and tag strings; interning collapses them onto the shared constants.
+    """
+    self.metaScorerOutput = {
+      sys.intern(scorerName): scorerOutput
+      for scorerName, scorerOutput in self.metaScorerOutput.items()
+    }
+    for scorerOutput in self.metaScorerOutput.values():
+      if scorerOutput.tagFilteringThresholds is not None:
+        scorerOutput.tagFilteringThresholds = {
+          sys.intern(tag): threshold
+          for tag, threshold in scorerOutput.tagFilteringThresholds.items()
+        }
+    return self
+
+
+@dataclass(frozen=True, slots=True)
 class SharedMemoryDataframeInfo:
   sharedMemoryName: str
   dataSize: int
+  offset: int = 0  # several dfs may be packed into one segment
 
+  def __post_init__(self):
+    object.__setattr__(self, "sharedMemoryName", sys.intern(self.sharedMemoryName))
 
-@dataclass
+
+@dataclass(slots=True)
 class ScoringArgsSharedMemory:
   noteTopics: SharedMemoryDataframeInfo
   ratings: SharedMemoryDataframeInfo
@@ -909,18 +1113,18 @@ class ScoringArgsSharedMemory:
   userEnrollment: SharedMemoryDataframeInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class PrescoringArgsSharedMemory(ScoringArgsSharedMemory):
   pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalScoringArgsSharedMemory(ScoringArgsSharedMemory):
   prescoringNoteModelOutput: SharedMemoryDataframeInfo
   prescoringRaterModelOutput: SharedMemoryDataframeInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoringArgs:
   noteTopics: pd.DataFrame
   ratings: pd.DataFrame
@@ -934,12 +1138,12 @@ class ScoringArgs:
     self.userEnrollment = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PrescoringArgs(ScoringArgs):
   pass
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalScoringArgs(ScoringArgs):
   prescoringNoteModelOutput: pd.DataFrame
   prescoringRaterModelOutput: pd.DataFrame
@@ -953,7 +1157,7 @@ class FinalScoringArgs(ScoringArgs):
     self.prescoringRaterModelOutput = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResult:
   scoredNotes: pd.DataFrame
   helpfulnessScores: pd.DataFrame
@@ -962,7 +1166,7 @@ class ModelResult:
   metaScores: Optional[PrescoringMetaScorerOutput]
 
 
-class RescoringRuleID(Enum):
+class RescoringRuleID(IntEnum):
   ALL_NOTES = 1
   NOTES_WITH_NEW_RATINGS = 2
   NOTES_FLIPPED_PREVIOUS_RUN = 3
@@ -973,9 +1177,26 @@ class RescoringRuleID(Enum):
   LOCKING_ELIGIBLE_RECENT_UNLOCKED_NOTES = 8
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteSubset:
-  noteSet: Optional[set]
+  noteSet: Optional[np.ndarray]
   maxNewCrhChurnRate: float
   maxOldCrhChurnRate: float
   description: RescoringRuleID
+
+  def __post_init__(self):
+    # Callers build subsets with set arithmetic; store them as a sorted, unique int64 array
+    # so membership over a whole noteId column is a single searchsorted.
+    if self.noteSet is not None:
+      self.noteSet = np.unique(np.fromiter(self.noteSet, dtype=np.int64, count=len(self.noteSet)))
+
+  def contains(self, noteIds: np.ndarray) -> np.ndarray:
+    """Return a boolean mask of which noteIds are in the subset (all True if noteSet is None)."""
+    if self.noteSet is None:
+      return np.ones(len(noteIds), dtype=bool)
+    if len(self.noteSet) == 0:
+      return np.zeros(len(noteIds), dtype=bool)
+    idx = np.searchsorted(self.noteSet, noteIds)
+    return (idx < len(self.noteSet)) & (
+      self.noteSet[idx.clip(max=len(self.noteSet) - 1)] == noteIds
+    )
@@ -317,6 +317,18 @@ def _transform_to_thrift_code(f):
   return f
 
 
+def _transform_to_thrift_codes(enrollmentStates: pd.Series) -> pd.Series:
+  """Vectorized equivalent of enrollmentStates.map(_transform_to_thrift_code).
+
+  Enrollment state strings are encoded through c.enrollmentStateCategories, whose codes
+  are the Thrift values; all other values (already converted codes, NaN) pass through.
+  """
+  if not pd.api.types.is_object_dtype(enrollmentStates):
+    return enrollmentStates.map(_transform_to_thrift_code)
+  codes = enrollmentStates.astype(c.enrollmentStateCategories).cat.codes
+  return enrollmentStates.where(codes < 0, codes).infer_objects()
+
+
 def is_emerging_writer(scoredNotes: pd.DataFrame):
   """
   A function that checks if a user is an emerging writer. Emerging writers have a
@@ -570,15 +582,15 @@ def get_contributor_state(
       newly_earned_in(contributorScoresWithEnrollment), c.timestampOfLastStateChange
     ] = c.epochMillis
 
-    contributorScoresWithEnrollment[c.enrollmentState] = contributorScoresWithEnrollment[
-      c.enrollmentState
-    ].map(_transform_to_thrift_code)
+    contributorScoresWithEnrollment[c.enrollmentState] = _transform_to_thrift_codes(
+      contributorScoresWithEnrollment[c.enrollmentState]
+    )
 
     mappedUserEnrollment = userEnrollment[
       [c.participantIdKey, c.timestampOfLastEarnOut, c.enrollmentState]
     ]
-    mappedUserEnrollment[c.enrollmentState] = mappedUserEnrollment[c.enrollmentState].map(
-      _transform_to_thrift_code
+    mappedUserEnrollment[c.enrollmentState] = _transform_to_thrift_codes(
+      mappedUserEnrollment[c.enrollmentState]
     )
     mappedUserEnrollment = mappedUserEnrollment.rename(
       columns={c.enrollmentState: c.enrollmentState + "_prev"}
@@ -134,11 +134,12 @@ def get_top_nonhelpful_tags_per_author(
   def _set_top_tags(row: pd.Series) -> pd.Series:
     # Note that row[c.firstTagKey] and row[c.secondTagKey] are both Counter
     # objects mapping tags to counts due to the aggregation above.
-    tagTuples = [
-      (count, c.notHelpfulTagsTiebreakMapping[tag], c.notHelpfulTagsEnumMapping[tag])
-      for tag, count in (row[c.firstTagKey] + row[c.secondTagKey]).items()
-      if (tag is not None) and not pd.isna(tag)
-    ]
+    tagTuples = []
+    for tag, count in (row[c.firstTagKey] + row[c.secondTagKey]).items():
+      if (tag is None) or pd.isna(tag):
+        continue
+      tsvId = c.notHelpfulTagsEnumMapping[tag]
+      tagTuples.append((count, c.notHelpfulTagTiebreakByEnum[tsvId], tsvId))
     tags = [tsvId for (_, tieBreakId, tsvId) in sorted(tagTuples, reverse=True)[:2]]
     topNotHelpfulTags = ",".join([str(tag) for tag in tags])
     row[c.authorTopNotHelpfulTagValues] = topNotHelpfulTags
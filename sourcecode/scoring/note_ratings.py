@@ -89,7 +89,7 @@ def get_ratings_before_note_status_and_public_tsv(
   ] *= 1.0
 
   if doTypeCheck:
-    ratingsWithNoteLabelInfoTypes = c.ratingTSVTypeMapping
+    ratingsWithNoteLabelInfoTypes = dict(c.ratingTSVTypeMapping)
     ratingsWithNoteLabelInfoTypes[
       c.createdAtMillisKey + "_note"
     ] = float  # float because nullable after merge.
@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import Optional
 
 from . import constants as c
@@ -210,10 +209,10 @@ def check_flips(mergedStatuses: pd.DataFrame, noteSubset: c.NoteSubset) -> None:
     mergedStatuses = mergedStatuses[mergedStatuses[c.timestampMillisOfStatusLockKey].isna()]
     # Prune to note subset
     logger.info(
-      f"Checking Flip Rate for note subset: {noteSubset.description} (unlocked only), with max new CRH churn: {noteSubset.maxNewCrhChurnRate}, and max old CRH churn: {noteSubset.maxOldCrhChurnRate}"
+      f"Checking Flip Rate for note subset: RescoringRuleID.{noteSubset.description.name} (unlocked only), with max new CRH churn: {noteSubset.maxNewCrhChurnRate}, and max old CRH churn: {noteSubset.maxOldCrhChurnRate}"
     )
     if noteSubset.noteSet is not None:
-      mergedStatuses = mergedStatuses[mergedStatuses[c.noteIdKey].isin(noteSubset.noteSet)]
+      mergedStatuses = mergedStatuses[noteSubset.contains(mergedStatuses[c.noteIdKey].to_numpy())]
 
     _check_flips(mergedStatuses, noteSubset.maxNewCrhChurnRate, noteSubset.maxOldCrhChurnRate)
 
@@ -299,7 +298,7 @@ def update_note_status_history(
   if c.useCurrentTimeInsteadOfEpochMillisForNoteStatusHistory:
     # When running in prod, we use the latest time possible, so as to include as many valid ratings
     # as possible, and be closest to the time the new note statuses are user-visible.
-    currentTimeMillis = 1000 * time.time()
+    currentTimeMillis = c.now_millis()
   else:
     # When running in test, we use the overridable epochMillis constant.
     currentTimeMillis = c.epochMillis
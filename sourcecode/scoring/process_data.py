@@ -696,6 +696,7 @@ class LocalDataLoader(CommunityNotesDataLoader):
     else:
       prescoringMetaOutput = joblib.load(self.prescoringMetaOutputPath)
     assert type(prescoringMetaOutput) == c.PrescoringMetaOutput
+    prescoringMetaOutput.intern_names()
 
     return (
       prescoringNoteModelOutput,
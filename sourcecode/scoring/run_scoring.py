@@ -7,9 +7,9 @@ intergrated into main files for execution in internal and external environments.
 import concurrent.futures
 import copy
 import gc
-import io
 from itertools import chain
 import logging
+import mmap
 import multiprocessing
 from multiprocessing import shared_memory  # type: ignore
 import os
@@ -51,6 +51,7 @@ from .topic_model import TopicModel
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import sklearn
 
 
@@ -301,22 +302,67 @@ def _run_scorer_parallelizable(
   return scoringResults, (scorerEndTime - scorerStartTime)
 
 
-def save_df_to_shared_memory(df: pd.DataFrame, shms: List) -> c.SharedMemoryDataframeInfo:
+def _write_df_as_arrow_stream(df: pd.DataFrame, sink, writeOptions) -> None:
+  """Convert df to an Arrow table and write it to sink as an Arrow IPC stream.
+
+  The table is scratch space: it is released when this returns, so callers converting several
+  dfs hold at most one Arrow copy at a time.
   """
-  Intended to be called before beginning multiprocessing: saves the df to shared memory
-  and returns the info needed to access it, as well as appends it to the list of shared memory objects
-  so it's not garbage collected and can be closed later.
+  table = pa.Table.from_pandas(df)
+  with pa.ipc.new_stream(sink, table.schema, options=writeOptions) as writer:
+    writer.write_table(table)
+
+
+def save_dfs_to_shared_memory(
+  dfs: List[pd.DataFrame], shms: List
+) -> List[c.SharedMemoryDataframeInfo]:
   """
-  with io.BytesIO() as buf:
-    df.to_parquet(buf, compression="gzip", engine="pyarrow")
-    size = len(buf.getvalue())
-    shm = shared_memory.SharedMemory(create=True, size=size)
-    shm.buf[:size] = buf.getvalue()
+  Intended to be called before beginning multiprocessing: saves the dfs back to back in a single
+  shared memory segment and returns the info needed to access each of them, as well as appends
+  the segment to the list of shared memory objects so it's not garbage collected and can be
+  closed later.
+  """
+  # Serialize to the Arrow IPC stream format: workers can rebuild the df without a Parquet
+  # decoding pass.  Buffers are zstd-compressed because the segment lives in /dev/shm (RAM) for
+  # the whole scorer run; uncompressed, ratings-shaped frames are ~8x larger.  Sizes are
+  # measured first so that the streams can be written straight into one segment sized for all
+  # of them (conversion and compression are deterministic, so the second write produces the
+  # same size).  Each df is converted once per pass rather than keeping every Arrow table alive
+  # until the segment is written.
+  writeOptions = pa.ipc.IpcWriteOptions(compression="zstd")
+  sizes = []
+  for df in dfs:
+    sink = pa.MockOutputStream()
+    _write_df_as_arrow_stream(df, sink, writeOptions)
+    sizes.append(sink.size())
+  shm = shared_memory.SharedMemory(create=True, size=max(sum(sizes), 1))
   shms.append(shm)  # save the shared memory object so we can close it later
-  return c.SharedMemoryDataframeInfo(
-    sharedMemoryName=shm.name,
-    dataSize=size,
-  )
+
+  sharedMemoryDfInfos = []
+  offset = 0
+  for df, size in zip(dfs, sizes):
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf[offset : offset + size]))
+    _write_df_as_arrow_stream(df, sink, writeOptions)
+    sink.close()
+    sharedMemoryDfInfos.append(
+      c.SharedMemoryDataframeInfo(
+        sharedMemoryName=shm.name,
+        dataSize=size,
+        offset=offset,
+      )
+    )
+    offset += size
+  # The Arrow tables were only scratch space for the copy into shared memory. Arrow's pool
+  # (jemalloc by default) keeps freed pages cached, so return them before the workers fork.
+  pa.default_memory_pool().release_unused()
+  return sharedMemoryDfInfos
+
+
+def save_df_to_shared_memory(df: pd.DataFrame, shms: List) -> c.SharedMemoryDataframeInfo:
+  """
+  Saves a single df to its own shared memory segment; see save_dfs_to_shared_memory.
+  """
+  return save_dfs_to_shared_memory([df], shms)[0]
 
 
 def get_df_from_shared_memory(sharedMemoryDfInfo: c.SharedMemoryDataframeInfo) -> pd.DataFrame:
@@ -325,9 +371,28 @@ def get_df_from_shared_memory(sharedMemoryDfInfo: c.SharedMemoryDataframeInfo) -
   Read a dataframe from shared memory and return it.
   """
   existing_shm = shared_memory.SharedMemory(name=sharedMemoryDfInfo.sharedMemoryName)
-  size = sharedMemoryDfInfo.dataSize
-  with io.BytesIO(existing_shm.buf[:size]) as buf:
-    return pd.read_parquet(buf)
+  # Slicing existing_shm.buf would copy the same range, but through SharedMemory's lazily
+  # faulted mapping of the whole segment: every page of the df takes its own minor fault
+  # during the copy.  Instead, map just this df's range with MAP_POPULATE (where available)
+  # so the kernel installs all of its page table entries in one call before the copy, and
+  # pages belonging to the other dfs in the segment are never touched.
+  # Note: this relies on the POSIX SharedMemory implementation exposing the segment's file
+  # descriptor as the private attribute _fd.
+  mapStart = sharedMemoryDfInfo.offset - sharedMemoryDfInfo.offset % mmap.ALLOCATIONGRANULARITY
+  start = sharedMemoryDfInfo.offset - mapStart
+  end = start + sharedMemoryDfInfo.dataSize
+  try:
+    with mmap.mmap(
+      existing_shm._fd,
+      end,
+      flags=mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0),
+      prot=mmap.PROT_READ,
+      offset=mapStart,
+    ) as mappedDf:
+      data = mappedDf[start:end]
+  finally:
+    existing_shm.close()
+  return pa.ipc.open_stream(data).read_pandas()
 
 
 def _save_dfs_to_shared_memory(
@@ -337,8 +402,8 @@ def _save_dfs_to_shared_memory(
   Save large dfs to shared memory. Called before beginning multiprocessing.
   """
   shms: List[shared_memory.SharedMemory] = []
-  noteTopics = save_df_to_shared_memory(scoringArgs.noteTopics, shms)
-  ratings = save_df_to_shared_memory(
+  dfs = [
+    scoringArgs.noteTopics,
     keep_columns(
       scoringArgs.ratings,
       [
@@ -351,30 +416,18 @@ def _save_dfs_to_shared_memory(
       + c.notHelpfulTagsTSVOrder
       + c.helpfulTagsTSVOrder,
     ),
-    shms,
-  )
-  noteStatusHistory = save_df_to_shared_memory(scoringArgs.noteStatusHistory, shms)
-  userEnrollment = save_df_to_shared_memory(scoringArgs.userEnrollment, shms)
+    scoringArgs.noteStatusHistory,
+    scoringArgs.userEnrollment,
+  ]
+  if type(scoringArgs) == FinalScoringArgs:
+    dfs.extend([scoringArgs.prescoringNoteModelOutput, scoringArgs.prescoringRaterModelOutput])
+  # All dfs share one segment, so workers map a single shared memory object.
+  sharedMemoryDfInfos = save_dfs_to_shared_memory(dfs, shms)
 
   if type(scoringArgs) == FinalScoringArgs:
-    prescoringNoteModelOutput = save_df_to_shared_memory(
-      scoringArgs.prescoringNoteModelOutput, shms
-    )
-    prescoringRaterModelOutput = save_df_to_shared_memory(
-      scoringArgs.prescoringRaterModelOutput, shms
-    )
-    return shms, c.FinalScoringArgsSharedMemory(
-      noteTopics,
-      ratings,
-      noteStatusHistory,
-      userEnrollment,
-      prescoringNoteModelOutput,
-      prescoringRaterModelOutput,
-    )
+    return shms, c.FinalScoringArgsSharedMemory(*sharedMemoryDfInfos)
   else:
-    return shms, c.PrescoringArgsSharedMemory(
-      noteTopics, ratings, noteStatusHistory, userEnrollment
-    )
+    return shms, c.PrescoringArgsSharedMemory(*sharedMemoryDfInfos)
 
 
 def _run_scorers(
@@ -415,6 +468,9 @@ def _run_scorers(
       # Pass mostly-empty scoringArgs: the data is too large to be copied in-memory to
       # each process, so must be re-loaded from disk by every scorer's dataLoader.
       scoringArgs.remove_large_args_for_multiprocessing()
+      # FinalScoringArgs keeps noteTopics for the dataLoader path, but every worker here reloads
+      # it from shared memory, so don't also ship a copy with each task.
+      scoringArgs.noteTopics = None
       futures = [
         executor.submit(
           _run_scorer_parallelizable,
@@ -523,7 +579,7 @@ def combine_prescorer_scorer_results(
   return (
     prescoringNoteModelOutput[c.prescoringNoteModelOutputTSVColumns],
     raterParamsUnfilteredMultiScorers[c.prescoringRaterModelOutputTSVColumns],
-    prescoringMetaOutput,
+    prescoringMetaOutput.intern_names(),
   )
 
 
@@ -1310,7 +1366,7 @@ def determine_which_notes_to_rescore(
     )
   )
 
-  currentMillis = int(time.time() * 1000)
+  currentMillis = int(c.now_millis())
 
   # 2. Rescore all recently created notes if not rescored at the minimum frequency.
   if recentNotesAgeCutoffMillis is not None and scoreRecentNotesMinimumFrequencyMillis is not None:
@@ -1514,7 +1570,7 @@ def run_final_note_scoring(
       logger.info("No previous scored notes passed; scoring all notes.")
       notesToRescoreSet: Set[int] = set()
       scoredNotesPassthrough = None
-      currentMillis = int(time.time() * 1000)
+      currentMillis = int(c.now_millis())
       recentNotesAgeTooOldCutoffMillis = (
         1000 * 60 * 60 * 24 * 13
       )  # 13 days: one less than final scoring to avoid boundary issues
@@ -1759,15 +1815,14 @@ def post_note_scoring(
       if checkFlips:
         note_status_history.check_flips(mergedNoteStatuses, noteSubset=noteSubset)
       if noteSubset.noteSet is not None:
-        noteInSetMask = scoredNotes[c.noteIdKey].isin(noteSubset.noteSet)
+        noteInSetMask = noteSubset.contains(scoredNotes[c.noteIdKey].to_numpy())
       else:
         noteInSetMask = scoredNotes[c.noteIdKey].notnull()  # All notes by default.
-      scoredNotes.loc[noteInSetMask, c.rescoringActiveRulesKey] = scoredNotes.loc[
-        noteInSetMask, c.rescoringActiveRulesKey
-      ].apply(
-        lambda rescoringActiveRules: rescoringActiveRules + noteSubset.description.name
-        if len(rescoringActiveRules) == 0
-        else f"{rescoringActiveRules},{noteSubset.description.name}"
+      rescoringActiveRules = scoredNotes.loc[noteInSetMask, c.rescoringActiveRulesKey]
+      # Append the rule name, comma-separated after any rules already recorded for the note.
+      scoredNotes.loc[noteInSetMask, c.rescoringActiveRulesKey] = (
+        rescoringActiveRules.where(rescoringActiveRules == "", rescoringActiveRules + ",")
+        + noteSubset.description.name
       )
 
     newNoteStatusHistory = note_status_history.update_note_status_history(mergedNoteStatuses)